@@ -7,6 +7,7 @@ from rest_framework.views import APIView
 
 from apps.users.api.serializers import UserRegisterRequestSerializer, UserResponseSerializer
 from apps.users.services import create_user
+from commons.redis.idempotency import idempotent
 
 
 class UserRegisterApi(APIView):
@@ -16,9 +17,12 @@ class UserRegisterApi(APIView):
     request_serializer = UserRegisterRequestSerializer
     response_serializer = UserResponseSerializer
 
+    @idempotent
     def post(self, request: Request) -> Response:
         """Обрабатывает POST запрос на регистрацию.
 
+        Поддерживает заголовок Idempotency-Key: повтор с тем же ключом получает сохранённый ответ.
+
         1. Валидирует входящие данные через InputSerializer.
         2. Вызывает сервис создания пользователя.
         3. Возвращает созданного пользователя через OutputSerializer.
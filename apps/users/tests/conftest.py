@@ -1,19 +1,9 @@
 from collections.abc import Callable
 from typing import Any
 
+import fakeredis
 import pytest
 from django.contrib.auth.base_user import AbstractBaseUser
-from rest_framework.test import APIClient
-
-
-@pytest.fixture
-def api_client() -> APIClient:
-    """
-    Фикстура для клиента API.
-
-    :return: экземпляр APIClient для выполнения HTTP-запросов в тестах
-    """
-    return APIClient()
 
 
 @pytest.fixture
@@ -49,3 +39,16 @@ def user_factory(
         )
 
     return make_user
+
+
+@pytest.fixture
+def fake_redis(mocker: Any) -> fakeredis.FakeRedis:
+    """
+    Фикстура подменяет общий Redis-клиент на in-memory реализацию.
+
+    :param mocker: фикстура pytest-mock
+    :return: экземпляр FakeRedis, используемый кодом вместо Redis
+    """
+    client = fakeredis.FakeRedis(decode_responses=True)
+    mocker.patch('commons.redis.idempotency.get_redis', return_value=client)
+    return client
@@ -0,0 +1,214 @@
+import hashlib
+import json
+from typing import Any
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.users.api import views
+from commons.redis.keys import idempotency_lock_key, idempotency_response_key
+
+pytestmark = [pytest.mark.django_db]
+
+REGISTER_URL = '/api/v1/users/register/'
+
+
+def _payload(email: str = 'retry@example.com') -> dict:
+    """
+    Формирует валидное тело запроса на регистрацию.
+
+    :param email: email пользователя
+    :return: тело запроса
+    """
+    return {
+        'email': email,
+        'password': 'strongpassword',
+        'confirm_password': 'strongpassword',
+    }
+
+
+def test_user_register_idempotent_replay(
+    api_client: APIClient,
+    fake_redis: fakeredis.FakeRedis,
+    mocker: Any,
+    django_user_model: Any,
+) -> None:
+    """
+    Проверяет, что повтор с тем же Idempotency-Key получает сохранённый ответ.
+
+    Arrange:
+        - Подменяем Redis и следим за вызовами create_user.
+        - Выполняем первый запрос с Idempotency-Key.
+
+    Act:
+        - Повторяем запрос с тем же ключом и телом.
+
+    Assert:
+        - Оба ответа 201 и совпадают по содержимому.
+        - Сервис вызван один раз, пользователь создан один.
+    """
+    spy_create_user = mocker.spy(views, 'create_user')
+    headers = {'Idempotency-Key': 'key-1'}
+
+    first = api_client.post(REGISTER_URL, data=_payload(), format='json', headers=headers)
+    second = api_client.post(REGISTER_URL, data=_payload(), format='json', headers=headers)
+
+    assert first.status_code == status.HTTP_201_CREATED
+    assert second.status_code == status.HTTP_201_CREATED
+    assert second.json() == first.json()
+    assert second.headers['Idempotent-Replayed'] == 'true'
+    assert spy_create_user.call_count == 1
+    assert django_user_model.objects.filter(email='retry@example.com').count() == 1
+
+
+def test_user_register_idempotency_key_payload_mismatch(
+    api_client: APIClient,
+    fake_redis: fakeredis.FakeRedis,
+) -> None:
+    """
+    Проверяет отклонение повторного использования ключа с другим телом запроса.
+
+    Arrange:
+        - Выполняем запрос с Idempotency-Key.
+
+    Act:
+        - Отправляем другое тело с тем же ключом.
+
+    Assert:
+        - Проверяем HTTP-статус 409 (Conflict).
+    """
+    headers = {'Idempotency-Key': 'key-2'}
+    api_client.post(REGISTER_URL, data=_payload(), format='json', headers=headers)
+
+    response = api_client.post(REGISTER_URL, data=_payload('other@example.com'), format='json', headers=headers)
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+
+def test_user_register_idempotency_key_in_progress(
+    api_client: APIClient,
+    fake_redis: fakeredis.FakeRedis,
+    settings: Any,
+    mocker: Any,
+) -> None:
+    """
+    Проверяет ответ на параллельный повтор, пока первый запрос не завершён.
+
+    Arrange:
+        - Уменьшаем время ожидания блокировки.
+        - Захватываем блокировку ключа, имитируя выполняющийся запрос.
+
+    Act:
+        - Отправляем запрос с тем же Idempotency-Key.
+
+    Assert:
+        - Проверяем HTTP-статус 409 (Conflict).
+        - Сервис создания пользователя не вызывался.
+    """
+    settings.IDEMPOTENCY_LOCK_WAIT = 0.1
+    mock_create_user = mocker.patch('apps.users.api.views.create_user')
+    fake_redis.set(idempotency_lock_key(scope=f'POST:{REGISTER_URL}:anonymous', key='key-3'), 'token')
+
+    response = api_client.post(REGISTER_URL, data=_payload(), format='json', headers={'Idempotency-Key': 'key-3'})
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    mock_create_user.assert_not_called()
+
+
+def test_user_register_idempotency_concurrent_duplicate_replays(
+    api_client: APIClient,
+    fake_redis: fakeredis.FakeRedis,
+    mocker: Any,
+) -> None:
+    """
+    Проверяет, что параллельный повтор дожидается блокировки и получает сохранённый ответ.
+
+    Arrange:
+        - Выполняем первый запрос и убираем его сохранённый ответ из Redis.
+        - Подменяем захват блокировки: ответ появляется в Redis, пока повтор ждёт.
+
+    Act:
+        - Отправляем повтор с тем же Idempotency-Key.
+
+    Assert:
+        - Повтор получает сохранённый ответ с заголовком Idempotent-Replayed.
+        - Сервис создания пользователя при повторе не вызывался.
+    """
+    headers = {'Idempotency-Key': 'key-4'}
+    first = api_client.post(REGISTER_URL, data=_payload(), format='json', headers=headers)
+    response_key = idempotency_response_key(scope=f'POST:{REGISTER_URL}:anonymous', key='key-4')
+    stored = fake_redis.get(response_key)
+    fake_redis.delete(response_key)
+
+    def acquire() -> bool:
+        fake_redis.set(response_key, stored)
+        return True
+
+    mocker.patch('redis.lock.Lock.acquire', side_effect=acquire)
+    spy_create_user = mocker.spy(views, 'create_user')
+
+    response = api_client.post(REGISTER_URL, data=_payload(), format='json', headers=headers)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.headers['Idempotent-Replayed'] == 'true'
+    assert response.json() == first.json()
+    spy_create_user.assert_not_called()
+
+
+def test_user_register_idempotency_redis_unavailable(
+    api_client: APIClient,
+    mocker: Any,
+    django_user_model: Any,
+) -> None:
+    """
+    Проверяет регистрацию с Idempotency-Key при недоступном Redis.
+
+    Arrange:
+        - Подменяем Redis клиентом, команды которого завершаются ошибкой соединения.
+
+    Act:
+        - Отправляем запрос на регистрацию с Idempotency-Key.
+
+    Assert:
+        - Проверяем HTTP-статус 201 (Created): запрос обработан без идемпотентности.
+        - Пользователь создан.
+    """
+    redis_client = mocker.Mock()
+    redis_client.get.side_effect = RedisConnectionError('Connection refused')
+    mocker.patch('commons.redis.idempotency.get_redis', return_value=redis_client)
+
+    response = api_client.post(REGISTER_URL, data=_payload(), format='json', headers={'Idempotency-Key': 'key-5'})
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert django_user_model.objects.filter(email='retry@example.com').exists()
+
+
+def test_user_register_idempotency_fingerprint_is_keyed(
+    api_client: APIClient,
+    fake_redis: fakeredis.FakeRedis,
+) -> None:
+    """
+    Проверяет, что отпечаток тела в Redis нельзя воспроизвести без SECRET_KEY.
+
+    Arrange:
+        - Вычисляем несолёный sha256 канонизированного тела запроса с паролем.
+
+    Act:
+        - Выполняем запрос с Idempotency-Key.
+
+    Assert:
+        - Сохранённый отпечаток не совпадает с несолёным sha256 тела.
+        - Пароль не попадает в сохранённую запись.
+    """
+    payload = _payload()
+    body = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+
+    api_client.post(REGISTER_URL, data=payload, format='json', headers={'Idempotency-Key': 'key-secret'})
+
+    scope = f'POST:{REGISTER_URL}:anonymous'
+    stored = fake_redis.get(idempotency_response_key(scope=scope, key='key-secret'))
+    assert json.loads(stored)['fingerprint'] != hashlib.sha256(body.encode()).hexdigest()
+    assert payload['password'] not in stored
@@ -0,0 +1,53 @@
+import hmac
+import ipaddress
+
+from django.conf import settings
+from rest_framework.permissions import BasePermission
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+
+class IsMetricsScraper(BasePermission):
+    """
+    Разрешает доступ к метрикам с адресов METRICS_ALLOWED_NETWORKS или по токену METRICS_TOKEN.
+
+    Токен передаётся в заголовке ``Authorization: Bearer <token>``. Адрес клиента берётся из
+    REMOTE_ADDR: за обратным прокси в список нужно добавить сеть, из которой ходит Prometheus.
+    """
+
+    def has_permission(self, request: Request, view: APIView) -> bool:
+        """
+        Проверяет адрес клиента и токен запроса.
+
+        :param request: объект HTTP запроса
+        :param view: обрабатывающий запрос APIView
+        :return: True, если доступ разрешён
+        """
+        return self._is_allowed_address(request.META.get('REMOTE_ADDR', '')) or self._has_valid_token(request)
+
+    @staticmethod
+    def _is_allowed_address(remote_addr: str) -> bool:
+        """
+        Проверяет, входит ли адрес клиента в одну из разрешённых сетей.
+
+        :param remote_addr: адрес клиента
+        :return: True, если адрес входит в METRICS_ALLOWED_NETWORKS
+        """
+        try:
+            address = ipaddress.ip_address(remote_addr)
+        except ValueError:
+            return False
+        return any(address in ipaddress.ip_network(network) for network in settings.METRICS_ALLOWED_NETWORKS)
+
+    @staticmethod
+    def _has_valid_token(request: Request) -> bool:
+        """
+        Сравнивает Bearer-токен запроса с METRICS_TOKEN.
+
+        :param request: объект HTTP запроса
+        :return: True, если токен задан в настройках и совпадает
+        """
+        if not settings.METRICS_TOKEN:
+            return False
+        scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+        return scheme.lower() == 'bearer' and hmac.compare_digest(token.encode(), settings.METRICS_TOKEN.encode())
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from commons.api.views import HealthzApi, MetricsApi, ReadyzApi
+
+app_name = 'commons_api'
+urlpatterns = [
+    path('healthz', HealthzApi.as_view(), name='healthz'),
+    path('readyz', ReadyzApi.as_view(), name='readyz'),
+    path('metrics', MetricsApi.as_view(), name='metrics'),
+]
@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from commons.api.permissions import IsMetricsScraper
+from commons.metrics import render_metrics
+from commons.probes import run_probes
+
+
+class HealthzApi(APIView):
+    """API endpoint проверки живости процесса (liveness)."""
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request: Request) -> Response:
+        """
+        Сообщает, что процесс обслуживает запросы; зависимости не проверяются.
+
+        :param request: Объект HTTP запроса.
+        :return: HTTP ответ 200.
+        """
+        return Response({'status': 'ok'}, status=status.HTTP_200_OK)
+
+
+class ReadyzApi(APIView):
+    """API endpoint проверки готовности процесса принимать трафик (readiness)."""
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def get(self, request: Request) -> Response:
+        """
+        Проверяет доступность БД (SELECT 1) и Redis (PING) с таймаутом READINESS_PROBE_TIMEOUT.
+
+        :param request: Объект HTTP запроса.
+        :return: HTTP ответ 200, если все проверки прошли, иначе 503; в теле - результат каждой проверки.
+        """
+        checks = run_probes(timeout=settings.READINESS_PROBE_TIMEOUT)
+        ready = all(check['ok'] for check in checks.values())
+        return Response(
+            {'status': 'ok' if ready else 'unavailable', 'checks': checks},
+            status=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+
+class MetricsApi(APIView):
+    """API endpoint метрик в формате Prometheus, доступный только Prometheus (см. IsMetricsScraper)."""
+
+    authentication_classes = []
+    permission_classes = [IsMetricsScraper]
+
+    def get(self, request: Request) -> HttpResponse:
+        """
+        Возвращает метрики, агрегированные по всем воркерам gunicorn.
+
+        :param request: Объект HTTP запроса.
+        :return: HTTP ответ в текстовом формате Prometheus или 403, если доступ не разрешён.
+        """
+        data, content_type = render_metrics()
+        return HttpResponse(data, content_type=content_type)
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class CommonsConfig(AppConfig):
+    """Конфигурация приложения общих компонентов."""
+
+    name = 'commons'
+    verbose_name = 'Общие компоненты'
@@ -0,0 +1,19 @@
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+from commons.metrics import PASSWORD_HASHING_IN_PROGRESS
+
+
+class InstrumentedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-хешер Django, публикующий число одновременно вычисляемых хешей в метрике."""
+
+    def encode(self, password: str, salt: str, iterations: int | None = None) -> str:
+        """
+        Вычисляет хеш пароля, учитывая его в password_hashing_in_progress.
+
+        :param password: пароль в открытом виде
+        :param salt: соль
+        :param iterations: число итераций или None для значения по умолчанию
+        :return: закодированный хеш
+        """
+        with PASSWORD_HASHING_IN_PROGRESS.track_inprogress():
+            return super().encode(password, salt, iterations)
@@ -0,0 +1,109 @@
+import json
+import os
+import subprocess  # nosec B404
+import sys
+from collections import defaultdict
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from commons.startup import ImportRecord, parse_importtime
+
+
+class Command(BaseCommand):
+    """Команда manage.py startup_profile."""
+
+    help = 'Профилирует запуск Django-процесса: импорты, ready() приложений и прогрев URLconf.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Добавляет аргументы команды.
+
+        :param parser: парсер аргументов
+        """
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=3,
+            help='Число запусков; отчёт строится по самому быстрому.',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=15,
+            help='Сколько самых медленных модулей показать.',
+        )
+        parser.add_argument(
+            '--budget-ms',
+            type=float,
+            default=settings.STARTUP_TIME_BUDGET_MS,
+            help='Бюджет времени запуска в миллисекундах; при превышении команда завершается с ошибкой.',
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        Запускает замеры в отдельных процессах, выводит отчёт и проверяет бюджет.
+
+        :raises CommandError: если замер завершился с ошибкой или бюджет превышен
+        """
+        runs = [self._run_probe() for _ in range(max(options['runs'], 1))]
+        timings, imports = min(runs, key=lambda run: run[0]['total_ms'])
+
+        self._report(timings, imports, top=options['top'])
+
+        budget_ms = options['budget_ms']
+        if timings['total_ms'] > budget_ms:
+            raise CommandError(f'Startup time {timings["total_ms"]:.1f} ms exceeds budget {budget_ms:.1f} ms.')
+        self.stdout.write(self.style.SUCCESS(f'Startup time is within budget {budget_ms:.1f} ms.'))
+
+    def _run_probe(self) -> tuple[dict[str, Any], list[ImportRecord]]:
+        """
+        Запускает commons.startup в новом интерпретаторе с -X importtime.
+
+        :return: длительности фаз и записи о времени импорта модулей
+        :raises CommandError: если процесс замера завершился с ошибкой
+        """
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings')}
+        result = subprocess.run(  # nosec B603
+            [sys.executable, '-X', 'importtime', '-m', 'commons.startup'],
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+            env=env,
+            check=False,
+        )
+        if result.returncode != 0:
+            errors = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+            raise CommandError('Startup probe failed:\n' + '\n'.join(errors))
+        return json.loads(result.stdout), parse_importtime(result.stderr)
+
+    def _report(self, timings: dict[str, Any], imports: list[ImportRecord], *, top: int) -> None:
+        """
+        Выводит отчёт о фазах запуска и самых медленных импортах.
+
+        :param timings: длительности фаз
+        :param imports: записи о времени импорта модулей
+        :param top: сколько модулей и пакетов показать
+        """
+        self.stdout.write(self.style.MIGRATE_HEADING('Phases:'))
+        self.stdout.write(f'  {"settings":<28}{timings["settings_ms"]:8.1f} ms')
+        self.stdout.write(f'  {"django.setup()":<28}{timings["setup_ms"]:8.1f} ms')
+        for label, ready_ms in sorted(timings['ready_ms'].items(), key=lambda item: -item[1]):
+            self.stdout.write(f'    {label + ".ready()":<26}{ready_ms:8.1f} ms')
+        self.stdout.write(f'  {"urlconf warmup":<28}{timings["urlconf_ms"]:8.1f} ms')
+        self.stdout.write(f'  {"total":<28}{timings["total_ms"]:8.1f} ms')
+
+        packages: dict[str, int] = defaultdict(int)
+        for record in imports:
+            packages[record.module.partition('.')[0]] += record.self_us
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'Top {top} packages by import time:'))
+        for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+            self.stdout.write(f'  {self_us / 1000:8.1f} ms  {package}')
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'Top {top} modules by self import time:'))
+        for record in sorted(imports, key=lambda item: -item.self_us)[:top]:
+            self_ms = record.self_us / 1000
+            cumulative_ms = record.cumulative_us / 1000
+            self.stdout.write(f'  {self_ms:8.1f} ms  (cumulative {cumulative_ms:8.1f} ms)  {record.module}')
@@ -0,0 +1,106 @@
+"""
+Метрики Prometheus.
+
+Под gunicorn каждый воркер пишет значения в файлы каталога ``PROMETHEUS_MULTIPROC_DIR``,
+а ``/metrics`` агрегирует их через ``MultiProcessCollector``. Gauge-метрики состояния процесса
+используют режим ``livesum``: значения умерших воркеров исключаются из суммы.
+"""
+
+import os
+
+from django.db import connections
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from commons.redis import get_redis
+
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency by URL name.',
+    ['view', 'method'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+REQUESTS_TOTAL = Counter(
+    'http_requests_total',
+    'HTTP requests by URL name and status code.',
+    ['view', 'method', 'status'],
+)
+DB_CONNECTIONS_OPEN = Gauge(
+    'db_connections_open',
+    'Open Django database connections.',
+    ['alias'],
+    multiprocess_mode='livesum',
+)
+DB_POOL_CONNECTIONS = Gauge(
+    'db_pool_connections',
+    'Database connection pool state (psycopg pool only).',
+    ['alias', 'state'],
+    multiprocess_mode='livesum',
+)
+REDIS_POOL_CONNECTIONS = Gauge(
+    'redis_pool_connections',
+    'Redis connection pool state.',
+    ['state'],
+    multiprocess_mode='livesum',
+)
+CACHE_REQUESTS = Counter(
+    'cache_requests_total',
+    'Cache lookups by cache name and result (hit or miss).',
+    ['cache', 'result'],
+)
+PASSWORD_HASHING_IN_PROGRESS = Gauge(
+    'password_hashing_in_progress',
+    'Password hashes currently being computed.',
+    multiprocess_mode='livesum',
+)
+PROBE_LATENCY = Histogram(
+    'readiness_probe_duration_seconds',
+    'Readiness probe latency by dependency.',
+    ['probe'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+
+def update_pool_metrics() -> None:
+    """
+    Обновляет метрики пулов соединений БД и Redis текущего процесса.
+
+    У ConnectionPool redis-py нет публичного API для состояния пула, поэтому приватные атрибуты
+    читаются с значениями по умолчанию: их отсутствие в другой версии или реализации пула не
+    должно ломать обработку запроса.
+    """
+    for connection in connections.all(initialized_only=True):
+        DB_CONNECTIONS_OPEN.labels(connection.alias).set(int(connection.connection is not None))
+        pool = getattr(connection, 'pool', None)
+        if pool is not None:
+            stats = pool.get_stats()
+            DB_POOL_CONNECTIONS.labels(connection.alias, 'size').set(stats.get('pool_size', 0))
+            DB_POOL_CONNECTIONS.labels(connection.alias, 'available').set(stats.get('pool_available', 0))
+            DB_POOL_CONNECTIONS.labels(connection.alias, 'waiting').set(stats.get('requests_waiting', 0))
+
+    pool = get_redis().connection_pool
+    REDIS_POOL_CONNECTIONS.labels('created').set(getattr(pool, '_created_connections', 0))
+    REDIS_POOL_CONNECTIONS.labels('available').set(len(getattr(pool, '_available_connections', ())))
+    REDIS_POOL_CONNECTIONS.labels('in_use').set(len(getattr(pool, '_in_use_connections', ())))
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Формирует ответ для /metrics.
+
+    :return: метрики в текстовом формате Prometheus и их content type
+    """
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,48 @@
+import time
+from collections.abc import Callable
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from commons.metrics import REQUEST_LATENCY, REQUESTS_TOTAL, update_pool_metrics
+
+
+class MetricsMiddleware:
+    """
+    Записывает латентность и статус запросов по имени URL и обновляет метрики пулов соединений.
+
+    Метрики пулов обновляются не чаще раза в METRICS_POOL_UPDATE_INTERVAL секунд на процесс.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        self.pool_metrics_updated_at: float | None = None
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """
+        Обрабатывает запрос и записывает метрики.
+
+        Метка view - имя URL (например, users_api:register), а не путь, чтобы число рядов не
+        зависело от параметров в URL.
+
+        :param request: объект HTTP запроса
+        :return: HTTP ответ
+        """
+        started_at = time.perf_counter()
+        response = self.get_response(request)
+        duration = time.perf_counter() - started_at
+
+        resolver_match = request.resolver_match
+        view = resolver_match.view_name if resolver_match else 'unresolved'
+        REQUEST_LATENCY.labels(view, request.method).observe(duration)
+        REQUESTS_TOTAL.labels(view, request.method, response.status_code).inc()
+
+        now = time.monotonic()
+        if (
+            self.pool_metrics_updated_at is None
+            or now - self.pool_metrics_updated_at >= settings.METRICS_POOL_UPDATE_INTERVAL
+        ):
+            self.pool_metrics_updated_at = now
+            update_pool_metrics()
+
+        return response
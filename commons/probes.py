@@ -0,0 +1,109 @@
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+
+from django.db import DatabaseError, connections
+
+from commons.metrics import PROBE_LATENCY
+from commons.redis import get_redis
+
+_executor: ThreadPoolExecutor | None = None
+_executor_pid: int | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Возвращает пул потоков проверок текущего процесса, создавая его при первом вызове.
+
+    Пул не создаётся при импорте: с preload_app модуль импортируется в master, и его блокировки
+    и потоки не переживают fork, а под gevent создаются до monkey-патча. Если процесс был
+    форкнут после создания пула, воркер создаёт собственный.
+
+    :return: пул потоков
+    """
+    global _executor, _executor_pid
+
+    pid = os.getpid()
+    if _executor is None or _executor_pid != pid:
+        _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='readiness-probe')
+        _executor_pid = pid
+    return _executor
+
+
+def check_database() -> None:
+    """
+    Выполняет SELECT 1 на основной БД.
+
+    Проверка выполняется в потоке пула, а соединения Django привязаны к потоку и не закрываются
+    сигналом request_finished, поэтому соединение закрывается сразу после проверки.
+
+    :raises DatabaseError: если БД недоступна
+    """
+    connection = connections['default']
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+    finally:
+        connection.close()
+
+
+def check_redis() -> None:
+    """
+    Выполняет PING в Redis.
+
+    :raises RedisError: если Redis недоступен
+    """
+    get_redis().ping()
+
+
+PROBES: dict[str, Callable[[], None]] = {
+    'database': check_database,
+    'redis': check_redis,
+}
+
+
+def _timed(name: str, check: Callable[[], None]) -> float:
+    """
+    Выполняет проверку и записывает её длительность в метрики.
+
+    :param name: имя проверки
+    :param check: функция проверки
+    :return: длительность проверки в секундах
+    """
+    started_at = time.perf_counter()
+    check()
+    duration = time.perf_counter() - started_at
+    PROBE_LATENCY.labels(name).observe(duration)
+    return duration
+
+
+def run_probes(*, timeout: float) -> dict[str, dict[str, Any]]:
+    """
+    Параллельно выполняет проверки зависимостей с общим таймаутом.
+
+    Проверки выполняются в пуле потоков, поэтому зависшее соединение не блокирует ответ дольше
+    timeout; зависшая проверка занимает поток пула, и следующие проверки тоже завершатся по таймауту.
+
+    :param timeout: таймаут на все проверки в секундах
+    :return: результат каждой проверки: ok, latency_ms или error
+    """
+    from redis.exceptions import RedisError
+
+    executor = _get_executor()
+    futures = {name: executor.submit(_timed, name, check) for name, check in PROBES.items()}
+    deadline = time.monotonic() + timeout
+
+    results = {}
+    for name, future in futures.items():
+        try:
+            duration = future.result(timeout=max(deadline - time.monotonic(), 0))
+        except FutureTimeoutError:
+            results[name] = {'ok': False, 'error': f'Timed out after {timeout} s.'}
+        except (DatabaseError, RedisError) as exc:
+            results[name] = {'ok': False, 'error': str(exc)}
+        else:
+            results[name] = {'ok': True, 'latency_ms': round(duration * 1000, 3)}
+    return results
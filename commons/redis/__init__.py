@@ -1,25 +1,35 @@
+from typing import TYPE_CHECKING
+
 from django.conf import settings
-from redis import Redis
 
-_redis_client: Redis | None = None
+if TYPE_CHECKING:
+    from redis import Redis
+
+_redis_client: 'Redis | None' = None
 
 
-def get_redis() -> Redis:
+def get_redis() -> 'Redis':
     """
     Возвращает общий Redis-клиент.
 
+    Пакет redis импортируется при первом вызове: он занимает заметную часть загрузки URLconf.
+
     :return: экземпляр Redis
     :raises RuntimeError: если клиент не может быть создан
     """
     global _redis_client
 
     if _redis_client is None:
+        from redis import Redis
+
         _redis_client = Redis(
             host=settings.REDIS_HOST,
             port=settings.REDIS_PORT,
             db=settings.REDIS_DB,
             password=settings.REDIS_PASSWORD,
             decode_responses=settings.REDIS_DECODE_RESPONSES,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
         )
 
     return _redis_client
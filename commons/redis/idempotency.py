@@ -0,0 +1,180 @@
+import contextlib
+import functools
+import json
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.utils.crypto import salted_hmac
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.views import APIView
+
+from commons.metrics import CACHE_REQUESTS
+from commons.redis import get_redis
+from commons.redis.keys import idempotency_lock_key, idempotency_response_key
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+IDEMPOTENCY_FINGERPRINT_SALT = 'commons.redis.idempotency.fingerprint'
+
+Handler = Callable[..., Response]
+
+
+def _get_scope(request: Request) -> str:
+    """
+    Возвращает область действия ключа: метод, путь и пользователь.
+
+    :param request: объект HTTP запроса
+    :return: строка области действия
+    """
+    user_id = request.user.pk if request.user.is_authenticated else 'anonymous'
+    return f'{request.method}:{request.path}:{user_id}'
+
+
+def _get_fingerprint(request: Request) -> str:
+    """
+    Вычисляет отпечаток тела запроса для сравнения повторов.
+
+    Тело может содержать пароли в открытом виде, поэтому отпечаток - HMAC на SECRET_KEY: по данным
+    из Redis нельзя перебирать пароли, как по несолёному sha256 от известного шаблона тела.
+
+    :param request: объект HTTP запроса
+    :return: HMAC-SHA256 от канонизированного JSON тела запроса
+    """
+    payload = json.dumps(request.data, cls=JSONEncoder, sort_keys=True, separators=(',', ':'))
+    return salted_hmac(IDEMPOTENCY_FINGERPRINT_SALT, payload, algorithm='sha256').hexdigest()
+
+
+def _replay(stored: str, fingerprint: str) -> Response:
+    """
+    Восстанавливает сохранённый ответ или отклоняет запрос с другим телом.
+
+    :param stored: сохранённый в Redis ответ
+    :param fingerprint: отпечаток текущего запроса
+    :return: сохранённый HTTP ответ или ответ 409
+    """
+    cached = json.loads(stored)
+    if cached['fingerprint'] != fingerprint:
+        return Response(
+            {'detail': 'Idempotency-Key has already been used with a different payload.'},
+            status=status.HTTP_409_CONFLICT,
+        )
+    CACHE_REQUESTS.labels('idempotency', 'hit').inc()
+    return Response(cached['data'], status=cached['status'], headers={'Idempotent-Replayed': 'true'})
+
+
+def _load(redis: 'Redis', response_key: str) -> str | None:
+    """
+    Читает сохранённый ответ; при ошибке Redis считает, что ответа нет.
+
+    :param redis: клиент Redis
+    :param response_key: ключ сохранённого ответа
+    :return: сохранённый ответ или None
+    """
+    from redis.exceptions import RedisError
+
+    try:
+        return redis.get(response_key)
+    except RedisError:
+        logger.warning('Failed to load idempotent response %s.', response_key, exc_info=True)
+        return None
+
+
+def _store(redis: 'Redis', response_key: str, fingerprint: str, response: Response) -> None:
+    """
+    Сохраняет ответ для последующих повторов; ошибка Redis только логируется.
+
+    :param redis: клиент Redis
+    :param response_key: ключ сохранённого ответа
+    :param fingerprint: отпечаток тела запроса
+    :param response: HTTP ответ обработчика
+    """
+    from redis.exceptions import RedisError
+
+    payload = json.dumps(
+        {'fingerprint': fingerprint, 'status': response.status_code, 'data': response.data},
+        cls=JSONEncoder,
+    )
+    try:
+        redis.set(response_key, payload, ex=settings.IDEMPOTENCY_KEY_TTL)
+    except RedisError:
+        logger.warning('Failed to store idempotent response %s.', response_key, exc_info=True)
+
+
+def idempotent(handler: Handler) -> Handler:
+    """
+    Делает обработчик APIView идемпотентным по заголовку Idempotency-Key.
+
+    Первый ответ сохраняется в Redis на IDEMPOTENCY_KEY_TTL секунд, повторы получают его без
+    вызова обработчика. Параллельный повтор ждёт блокировку не дольше IDEMPOTENCY_LOCK_WAIT секунд.
+    Ответы 5xx не сохраняются, чтобы клиент мог повторить запрос. Если Redis недоступен, запрос
+    обрабатывается без идемпотентности.
+
+    :param handler: метод APIView (post, put, patch, delete)
+    :return: обёрнутый метод
+    """
+
+    @functools.wraps(handler)
+    def wrapper(view: APIView, request: Request, *args: Any, **kwargs: Any) -> Response:
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if key is None:
+            return handler(view, request, *args, **kwargs)
+
+        if not key or len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+            return Response(
+                {'detail': f'Idempotency-Key must be 1 to {IDEMPOTENCY_KEY_MAX_LENGTH} characters long.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        from redis.exceptions import RedisError
+
+        scope = _get_scope(request)
+        fingerprint = _get_fingerprint(request)
+        redis = get_redis()
+        response_key = idempotency_response_key(scope=scope, key=key)
+
+        try:
+            stored = redis.get(response_key)
+            if stored is not None:
+                return _replay(stored, fingerprint)
+
+            lock = redis.lock(
+                idempotency_lock_key(scope=scope, key=key),
+                timeout=settings.IDEMPOTENCY_LOCK_TIMEOUT,
+                blocking_timeout=settings.IDEMPOTENCY_LOCK_WAIT,
+            )
+            if not lock.acquire():
+                return Response(
+                    {'detail': 'A request with this Idempotency-Key is still being processed.'},
+                    status=status.HTTP_409_CONFLICT,
+                )
+        except RedisError:
+            logger.warning('Idempotency storage is unavailable, handling request without it.', exc_info=True)
+            return handler(view, request, *args, **kwargs)
+
+        try:
+            stored = _load(redis, response_key)
+            if stored is not None:
+                return _replay(stored, fingerprint)
+
+            CACHE_REQUESTS.labels('idempotency', 'miss').inc()
+            response = handler(view, request, *args, **kwargs)
+            if not status.is_server_error(response.status_code):
+                _store(redis, response_key, fingerprint, response)
+            return response
+        finally:
+            # LockError - блокировка истекла по timeout, пока выполнялся обработчик;
+            # ошибки соединения не должны превращать уже обработанный запрос в 500.
+            with contextlib.suppress(RedisError):
+                lock.release()
+
+    return wrapper
@@ -0,0 +1,23 @@
+IDEMPOTENCY_PREFIX = 'idempotency'
+
+
+def idempotency_response_key(*, scope: str, key: str) -> str:
+    """
+    Возвращает ключ Redis для сохранённого ответа идемпотентного запроса.
+
+    :param scope: область действия ключа (эндпоинт и пользователь)
+    :param key: значение заголовка Idempotency-Key
+    :return: ключ Redis
+    """
+    return f'{IDEMPOTENCY_PREFIX}:{scope}:{key}:response'
+
+
+def idempotency_lock_key(*, scope: str, key: str) -> str:
+    """
+    Возвращает ключ Redis для блокировки обработки идемпотентного запроса.
+
+    :param scope: область действия ключа (эндпоинт и пользователь)
+    :param key: значение заголовка Idempotency-Key
+    :return: ключ Redis
+    """
+    return f'{IDEMPOTENCY_PREFIX}:{scope}:{key}:lock'
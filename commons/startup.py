@@ -0,0 +1,102 @@
+"""
+Замер времени запуска Django-процесса.
+
+Модуль запускается в отдельном интерпретаторе командой ``startup_profile``:
+``python -X importtime -m commons.startup``. На верхнем уровне импортируется только stdlib,
+чтобы замер не включал импорты самого профилировщика.
+"""
+
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any
+
+IMPORTTIME_PREFIX = 'import time:'
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """Время импорта модуля из вывода ``-X importtime`` в микросекундах."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """
+    Разбирает вывод ``python -X importtime``.
+
+    :param output: stderr процесса, запущенного с ``-X importtime``
+    :return: записи о модулях в порядке завершения импорта
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        self_us, cumulative_us, module = line.removeprefix(IMPORTTIME_PREFIX).split('|')
+        if not self_us.strip().isdigit():
+            continue
+        records.append(ImportRecord(module.strip(), int(self_us), int(cumulative_us)))
+    return records
+
+
+def measure_startup() -> dict[str, Any]:
+    """
+    Измеряет фазы запуска: загрузку настроек, django.setup() с ready() приложений и прогрев URLconf.
+
+    :return: длительности фаз в миллисекундах
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    started_at = time.perf_counter()
+
+    import django
+    from django.apps import AppConfig
+    from django.conf import settings
+
+    ready_ms: dict[str, float] = {}
+    original_create = AppConfig.create.__func__
+
+    def create(cls: type[AppConfig], entry: str) -> AppConfig:
+        app_config = original_create(cls, entry)
+        ready = app_config.ready
+
+        def timed_ready() -> None:
+            ready_started_at = time.perf_counter()
+            ready()
+            ready_ms[app_config.label] = (time.perf_counter() - ready_started_at) * 1000
+
+        app_config.ready = timed_ready
+        return app_config
+
+    AppConfig.create = classmethod(create)
+
+    phase_started_at = time.perf_counter()
+    settings.INSTALLED_APPS  # noqa: B018
+    settings_ms = (time.perf_counter() - phase_started_at) * 1000
+
+    phase_started_at = time.perf_counter()
+    django.setup()
+    setup_ms = (time.perf_counter() - phase_started_at) * 1000
+
+    from django.urls import get_resolver
+
+    phase_started_at = time.perf_counter()
+    resolver = get_resolver()
+    resolver.url_patterns  # noqa: B018
+    resolver.reverse_dict  # noqa: B018
+    urlconf_ms = (time.perf_counter() - phase_started_at) * 1000
+
+    return {
+        'settings_ms': settings_ms,
+        'setup_ms': setup_ms,
+        'ready_ms': ready_ms,
+        'urlconf_ms': urlconf_ms,
+        'total_ms': (time.perf_counter() - started_at) * 1000,
+    }
+
+
+if __name__ == '__main__':
+    sys.stdout.write(json.dumps(measure_startup()))
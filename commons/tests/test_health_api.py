@@ -0,0 +1,147 @@
+from typing import Any
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_framework import status
+from rest_framework.test import APIClient
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_healthz(api_client: APIClient) -> None:
+    """
+    Проверяет liveness-эндпоинт.
+
+    Arrange:
+        - Готовим GET-запрос к /healthz.
+
+    Act:
+        - Выполняем запрос через APIClient.
+
+    Assert:
+        - Проверяем HTTP-статус 200 (OK).
+    """
+    response = api_client.get('/healthz')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['status'] == 'ok'
+
+
+def test_readyz_success(api_client: APIClient, mocker: Any) -> None:
+    """
+    Проверяет readiness-эндпоинт при доступных БД и Redis.
+
+    Arrange:
+        - Подменяем Redis на in-memory реализацию.
+
+    Act:
+        - Выполняем GET-запрос к /readyz.
+
+    Assert:
+        - Проверяем HTTP-статус 200 (OK).
+        - Обе проверки успешны и содержат латентность.
+    """
+    mocker.patch('commons.probes.get_redis', return_value=fakeredis.FakeRedis())
+
+    response = api_client.get('/readyz')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data['checks']['database']['ok'] is True
+    assert response.data['checks']['redis']['ok'] is True
+    assert 'latency_ms' in response.data['checks']['redis']
+
+
+def test_readyz_redis_unavailable(api_client: APIClient, mocker: Any) -> None:
+    """
+    Проверяет readiness-эндпоинт при недоступном Redis.
+
+    Arrange:
+        - Подменяем Redis клиентом, PING которого завершается ошибкой соединения.
+
+    Act:
+        - Выполняем GET-запрос к /readyz.
+
+    Assert:
+        - Проверяем HTTP-статус 503 (Service Unavailable).
+        - Проверка Redis содержит ошибку, проверка БД успешна.
+    """
+    redis_client = mocker.Mock()
+    redis_client.ping.side_effect = RedisConnectionError('Connection refused')
+    mocker.patch('commons.probes.get_redis', return_value=redis_client)
+
+    response = api_client.get('/readyz')
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.data['checks']['database']['ok'] is True
+    assert response.data['checks']['redis'] == {'ok': False, 'error': 'Connection refused'}
+
+
+def test_metrics_exposes_request_latency_by_url_name(api_client: APIClient) -> None:
+    """
+    Проверяет, что /metrics публикует латентность запросов по имени URL.
+
+    Arrange:
+        - Выполняем запрос к /api/v1/users/me/.
+
+    Act:
+        - Выполняем GET-запрос к /metrics.
+
+    Assert:
+        - Проверяем HTTP-статус 200 (OK).
+        - В ответе есть гистограмма с меткой view="users_api:me" и метрики пулов.
+    """
+    api_client.get('/api/v1/users/me/')
+
+    response = api_client.get('/metrics')
+
+    body = response.content.decode()
+    assert response.status_code == status.HTTP_200_OK
+    assert 'http_request_duration_seconds_bucket{le="0.005",method="GET",view="users_api:me"}' in body
+    assert 'redis_pool_connections' in body
+    assert 'password_hashing_in_progress' in body
+
+
+def test_metrics_forbidden_for_other_networks(api_client: APIClient) -> None:
+    """
+    Проверяет, что /metrics недоступен с адресов вне METRICS_ALLOWED_NETWORKS.
+
+    Arrange:
+        - Готовим запрос с внешнего адреса без токена.
+
+    Act:
+        - Выполняем GET-запрос к /metrics.
+
+    Assert:
+        - Проверяем HTTP-статус 403 (Forbidden).
+    """
+    response = api_client.get('/metrics', REMOTE_ADDR='203.0.113.10')
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.parametrize(
+    ('authorization', 'expected_status'),
+    [
+        ('Bearer scrape-token', status.HTTP_200_OK),
+        ('Bearer wrong-token', status.HTTP_403_FORBIDDEN),
+    ],
+)
+def test_metrics_token(api_client: APIClient, settings: Any, authorization: str, expected_status: int) -> None:
+    """
+    Проверяет доступ к /metrics по токену METRICS_TOKEN с внешнего адреса.
+
+    Arrange:
+        - Задаём METRICS_TOKEN.
+
+    Act:
+        - Выполняем GET-запрос к /metrics с внешнего адреса и заголовком Authorization.
+
+    Assert:
+        - С верным токеном доступ разрешён, с неверным - 403 (Forbidden).
+    """
+    settings.METRICS_TOKEN = 'scrape-token'
+
+    response = api_client.get('/metrics', REMOTE_ADDR='203.0.113.10', HTTP_AUTHORIZATION=authorization)
+
+    assert response.status_code == expected_status
@@ -0,0 +1,57 @@
+from typing import Any
+
+from django.http import HttpRequest, HttpResponse
+from prometheus_client import REGISTRY
+
+from commons.metrics import update_pool_metrics
+from commons.middleware import MetricsMiddleware
+
+
+def test_pool_metrics_update_throttled(mocker: Any, settings: Any) -> None:
+    """
+    Проверяет, что метрики пулов обновляются не чаще METRICS_POOL_UPDATE_INTERVAL.
+
+    Arrange:
+        - Задаём интервал 5 секунд и подменяем часы и update_pool_metrics.
+
+    Act:
+        - Обрабатываем запросы на 0, 1 и 6 секунде.
+
+    Assert:
+        - Метрики пулов обновлены на первом и третьем запросе.
+    """
+    settings.METRICS_POOL_UPDATE_INTERVAL = 5.0
+    mocker.patch('commons.middleware.time.monotonic', side_effect=[100.0, 101.0, 106.0])
+    update = mocker.patch('commons.middleware.update_pool_metrics')
+    middleware = MetricsMiddleware(lambda request: HttpResponse())
+
+    request = HttpRequest()
+    request.method = 'GET'
+
+    for _ in range(3):
+        middleware(request)
+
+    assert update.call_count == 2
+
+
+def test_update_pool_metrics_without_private_pool_attributes(mocker: Any) -> None:
+    """
+    Проверяет обновление метрик Redis для пула без приватных атрибутов redis-py.
+
+    Arrange:
+        - Подменяем Redis клиентом, у пула которого нет _created_connections и списков соединений.
+
+    Act:
+        - Вызываем update_pool_metrics.
+
+    Assert:
+        - Ошибки нет, метрики пула Redis равны 0.
+    """
+    redis_client = mocker.Mock()
+    redis_client.connection_pool = object()
+    mocker.patch('commons.metrics.get_redis', return_value=redis_client)
+
+    update_pool_metrics()
+
+    assert REGISTRY.get_sample_value('redis_pool_connections', {'state': 'created'}) == 0
+    assert REGISTRY.get_sample_value('redis_pool_connections', {'state': 'in_use'}) == 0
@@ -0,0 +1,67 @@
+import importlib
+from typing import Any
+
+import pytest
+from django.db import DatabaseError, connections
+
+from commons import probes
+
+
+def test_executor_created_lazily_per_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Проверяет, что пул потоков проверок не создаётся при импорте и пересоздаётся после fork.
+
+    С preload_app модуль импортируется в master; пул, созданный до fork (и до monkey-патча gevent),
+    блокировал воркеры.
+
+    Arrange:
+        - Заново импортируем модуль проверок.
+
+    Act:
+        - Получаем пул, затем имитируем fork сменой pid и получаем пул снова.
+
+    Assert:
+        - После импорта пула нет; в одном процессе пул переиспользуется, после fork создаётся новый.
+    """
+    importlib.reload(probes)
+    assert probes._executor is None
+
+    executor = probes._get_executor()
+    assert probes._get_executor() is executor
+
+    monkeypatch.setattr(probes.os, 'getpid', lambda: -1)
+    forked_executor = probes._get_executor()
+
+    assert forked_executor is not executor
+    executor.shutdown()
+    forked_executor.shutdown()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('error', [None, DatabaseError('Connection refused')])
+def test_check_database_closes_connection(mocker: Any, error: Exception | None) -> None:
+    """
+    Проверяет, что проверка БД закрывает соединение своего потока.
+
+    Arrange:
+        - Подменяем курсор соединения: запрос выполняется успешно или завершается ошибкой.
+
+    Act:
+        - Вызываем check_database.
+
+    Assert:
+        - Соединение закрыто в обоих случаях, ошибка БД пробрасывается.
+    """
+    connection = connections['default']
+    cursor = mocker.MagicMock()
+    cursor.__enter__.return_value.execute.side_effect = error
+    mocker.patch.object(connection, 'cursor', return_value=cursor)
+    close = mocker.patch.object(connection, 'close')
+
+    if error is None:
+        probes.check_database()
+    else:
+        with pytest.raises(DatabaseError):
+            probes.check_database()
+
+    close.assert_called_once_with()
@@ -0,0 +1,75 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from commons.startup import ImportRecord, parse_importtime
+
+
+def test_parse_importtime() -> None:
+    """
+    Проверяет разбор вывода python -X importtime.
+
+    Arrange:
+        - Готовим вывод с заголовком, модулями и посторонней строкой.
+
+    Act:
+        - Вызываем parse_importtime.
+
+    Assert:
+        - Заголовок и посторонние строки пропущены, модули разобраны.
+    """
+    output = (
+        'import time: self [us] | cumulative | imported package\n'
+        'import time:       120 |        120 |   redis.exceptions\n'
+        'import time:       300 |        420 | redis\n'
+        'Traceback (most recent call last):\n'
+    )
+
+    records = parse_importtime(output)
+
+    assert records == [
+        ImportRecord(module='redis.exceptions', self_us=120, cumulative_us=120),
+        ImportRecord(module='redis', self_us=300, cumulative_us=420),
+    ]
+
+
+def test_startup_profile_within_budget() -> None:
+    """
+    Проверяет отчёт команды startup_profile при соблюдении бюджета.
+
+    Arrange:
+        - Задаём заведомо достаточный бюджет.
+
+    Act:
+        - Вызываем команду startup_profile.
+
+    Assert:
+        - Отчёт содержит фазы запуска и сообщение о соблюдении бюджета.
+    """
+    stdout = StringIO()
+
+    call_command('startup_profile', runs=1, budget_ms=60_000, stdout=stdout)
+
+    output = stdout.getvalue()
+    assert 'django.setup()' in output
+    assert 'urlconf warmup' in output
+    assert 'within budget' in output
+
+
+def test_startup_profile_budget_exceeded() -> None:
+    """
+    Проверяет ошибку команды startup_profile при превышении бюджета.
+
+    Arrange:
+        - Задаём бюджет, который невозможно соблюсти.
+
+    Act:
+        - Вызываем команду startup_profile.
+
+    Assert:
+        - Команда завершается CommandError.
+    """
+    with pytest.raises(CommandError, match='exceeds budget'):
+        call_command('startup_profile', runs=1, budget_ms=0.001, stdout=StringIO())
@@ -0,0 +1,147 @@
+"""
+Конфигурация gunicorn для production-режима.
+
+Запуск: ``gunicorn --config config/gunicorn.py``. Параметры переопределяются переменными окружения:
+
+- ``GUNICORN_WORKER_CLASS`` - ``sync`` (по умолчанию), ``gevent`` или ``uvicorn`` (ASGI);
+- ``GUNICORN_WORKERS`` - число воркеров, по умолчанию выводится из числа CPU;
+- ``GUNICORN_THREADS``, ``GUNICORN_WORKER_CONNECTIONS``, ``GUNICORN_TIMEOUT``,
+  ``GUNICORN_MAX_REQUESTS``, ``GUNICORN_BIND``, ``GUNICORN_LOG_LEVEL``;
+- ``GUNICORN_PRELOAD`` - загрузка и прогрев приложения в master до fork (по умолчанию включена);
+- ``PROMETHEUS_MULTIPROC_DIR`` - каталог, через который воркеры публикуют метрики для ``/metrics``.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+_started_at = time.perf_counter()
+
+# Задаётся до загрузки приложения: prometheus_client выбирает режим хранения метрик при импорте,
+# а с preload_app метрики создаются в master ещё до on_starting.
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/prometheus_multiproc')  # nosec B108
+Path(os.environ['PROMETHEUS_MULTIPROC_DIR']).mkdir(parents=True, exist_ok=True)
+
+WORKER_CLASSES = {
+    'sync': 'sync',
+    'gevent': 'gevent',
+    'uvicorn': 'uvicorn_worker.UvicornWorker',
+}
+
+_worker_type = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+if _worker_type not in WORKER_CLASSES:
+    raise RuntimeError(f'GUNICORN_WORKER_CLASS must be one of {", ".join(WORKER_CLASSES)}, got {_worker_type!r}')
+
+if _worker_type == 'gevent':
+    # С preload_app приложение импортируется в master до fork, а воркер gevent патчит stdlib только
+    # после fork. Без патча здесь threading, queue и socket приложения остаются блокирующими.
+    from gevent import monkey
+
+    monkey.patch_all()
+
+
+def _default_workers() -> int:
+    """
+    Выводит число воркеров из числа доступных CPU.
+
+    Синхронные воркеры блокируются на I/O, поэтому для них используется формула 2 * CPU + 1;
+    gevent и uvicorn обслуживают конкурентные запросы внутри процесса - по одному на CPU.
+
+    :return: число воркеров
+    """
+    cpu_count = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+    if _worker_type == 'sync':
+        return cpu_count * 2 + 1
+    return cpu_count
+
+
+wsgi_app = 'config.asgi:application' if _worker_type == 'uvicorn' else 'config.wsgi:application'
+worker_class = WORKER_CLASSES[_worker_type]
+workers = int(os.environ.get('GUNICORN_WORKERS', _default_workers()))
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')  # nosec B104
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() in ('1', 'true', 'yes')
+
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 2))
+
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+accesslog = '-'
+errorlog = '-'
+
+
+def on_starting(server: Any) -> None:
+    """
+    Очищает каталог метрик от файлов предыдущего запуска.
+
+    Файлы master тоже удаляются: воркеры после fork открывают собственные файлы по своему pid.
+
+    :param server: экземпляр gunicorn Arbiter
+    """
+    for metrics_file in Path(os.environ['PROMETHEUS_MULTIPROC_DIR']).glob('*.db'):
+        metrics_file.unlink()
+
+
+def when_ready(server: Any) -> None:
+    """
+    Прогревает приложение в master-процессе перед запуском воркеров и логирует время холодного старта.
+
+    :param server: экземпляр gunicorn Arbiter
+    """
+    if preload_app:
+        from config.warmup import get_memory_kb, warmup_application
+
+        warmup_application()
+        server.log.info('Master warmed up: rss=%d KiB', get_memory_kb()[0])
+
+    server.log.info(
+        'Cold start: %.3fs to ready (worker_class=%s, workers=%d, preload=%s)',
+        time.perf_counter() - _started_at,
+        _worker_type,
+        workers,
+        preload_app,
+    )
+
+
+def post_worker_init(worker: Any) -> None:
+    """
+    Открывает соединения воркера и логирует его RSS и время готовности.
+
+    :param worker: экземпляр gunicorn Worker
+    """
+    from django.db import DatabaseError
+    from redis.exceptions import RedisError
+
+    from config.warmup import get_memory_kb, prime_connections
+
+    try:
+        prime_connections(database=_worker_type == 'sync')
+    except (DatabaseError, RedisError) as exc:
+        worker.log.warning('Worker %s: connection priming failed: %s', worker.pid, exc)
+
+    rss, private = get_memory_kb()
+    worker.log.info(
+        'Worker %s ready: %.3fs since master start, rss=%d KiB, private=%d KiB',
+        worker.pid,
+        time.perf_counter() - _started_at,
+        rss,
+        private,
+    )
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    """
+    Исключает метрики завершившегося воркера из livesum-агрегатов.
+
+    :param server: экземпляр gunicorn Arbiter
+    :param worker: экземпляр завершившегося gunicorn Worker
+    """
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -23,10 +23,12 @@ INSTALLED_APPS = [
     # Dependency apps
     'rest_framework',
     # Local apps
+    'commons',
     'apps.users',
 ]
 
 MIDDLEWARE = [
+    'commons.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -64,6 +66,14 @@ DATABASES = {
 
 AUTH_USER_MODEL = 'users.User'
 
+PASSWORD_HASHERS = [
+    'commons.hashers.InstrumentedPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -101,3 +111,17 @@ REDIS_PORT: int = env.int('REDIS_PORT', 6379)
 REDIS_DB: int = env.int('REDIS_DB', 0)
 REDIS_PASSWORD: str = env.str('REDIS_PASSWORD', None)
 REDIS_DECODE_RESPONSES: bool = True
+REDIS_SOCKET_CONNECT_TIMEOUT: float = env.float('REDIS_SOCKET_CONNECT_TIMEOUT', 2.0)
+REDIS_SOCKET_TIMEOUT: float = env.float('REDIS_SOCKET_TIMEOUT', 5.0)
+
+IDEMPOTENCY_KEY_TTL: int = env.int('IDEMPOTENCY_KEY_TTL', 60 * 60 * 24)
+IDEMPOTENCY_LOCK_TIMEOUT: int = env.int('IDEMPOTENCY_LOCK_TIMEOUT', 30)
+IDEMPOTENCY_LOCK_WAIT: float = env.float('IDEMPOTENCY_LOCK_WAIT', 5.0)
+
+STARTUP_TIME_BUDGET_MS: float = env.float('STARTUP_TIME_BUDGET_MS', 1500.0)
+
+READINESS_PROBE_TIMEOUT: float = env.float('READINESS_PROBE_TIMEOUT', 1.0)
+
+METRICS_ALLOWED_NETWORKS: list[str] = env.list('METRICS_ALLOWED_NETWORKS', default=['127.0.0.1/32', '::1/128'])
+METRICS_TOKEN: str = env.str('METRICS_TOKEN', None)
+METRICS_POOL_UPDATE_INTERVAL: float = env.float('METRICS_POOL_UPDATE_INTERVAL', 5.0)
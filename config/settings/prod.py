@@ -1 +1,41 @@
-# Production settings
\ No newline at end of file
+# Production settings
+# Переменные base.py доступны через общий namespace django-split-settings.
+# ruff: noqa: F821
+
+from urllib.parse import quote
+
+DEBUG = False
+
+MIDDLEWARE.insert(
+    MIDDLEWARE.index('django.middleware.security.SecurityMiddleware') + 1,
+    'django.middleware.gzip.GZipMiddleware',
+)
+
+TEMPLATES[0]['APP_DIRS'] = False
+TEMPLATES[0]['OPTIONS']['loaders'] = [
+    (
+        'django.template.loaders.cached.Loader',
+        [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ],
+    ),
+]
+
+# Постоянные соединения переиспользуются только потоком sync-воркера; в gevent/ASGI воркерах каждый
+# greenlet/поток запроса открывает своё соединение, и с CONN_MAX_AGE > 0 они копятся до лимита БД.
+_persistent_connections = env.str('GUNICORN_WORKER_CLASS', 'sync') == 'sync'
+DATABASES['default']['CONN_MAX_AGE'] = env.int('DJANGO_CONN_MAX_AGE', 60 if _persistent_connections else 0)
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+# Пароль экранируется: символы @, /, : и % в нём иначе ломают разбор URL.
+_redis_auth = f':{quote(REDIS_PASSWORD, safe="")}@' if REDIS_PASSWORD else ''
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': env.str('DJANGO_CACHE_URL', f'redis://{_redis_auth}{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}'),
+        'KEY_PREFIX': 'cache',
+        'TIMEOUT': env.int('DJANGO_CACHE_TIMEOUT', 300),
+    },
+}
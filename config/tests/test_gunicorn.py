@@ -0,0 +1,106 @@
+import importlib.util
+import os
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+GUNICORN_CONFIG = Path(__file__).resolve().parent.parent / 'gunicorn.py'
+
+
+@pytest.fixture
+def load_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Callable[..., ModuleType]:
+    """
+    Фикстура загрузки config/gunicorn.py с заданными переменными окружения.
+
+    Конфигурация читает окружение при импорте, поэтому каждый вызов исполняет файл заново.
+
+    :return: функция, принимающая переменные окружения и возвращающая модуль конфигурации
+    """
+    monkeypatch.setenv('PROMETHEUS_MULTIPROC_DIR', str(tmp_path))
+    monkeypatch.delenv('GUNICORN_WORKERS', raising=False)
+
+    def load(**environ: str) -> ModuleType:
+        for name, value in environ.items():
+            monkeypatch.setenv(name, value)
+        spec = importlib.util.spec_from_file_location('gunicorn_config', GUNICORN_CONFIG)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    return load
+
+
+@pytest.mark.parametrize(
+    ('worker_class', 'expected_workers'),
+    [
+        ('sync', 9),
+        ('uvicorn', 4),
+    ],
+)
+def test_default_workers(
+    load_config: Callable[..., ModuleType],
+    monkeypatch: pytest.MonkeyPatch,
+    worker_class: str,
+    expected_workers: int,
+) -> None:
+    """
+    Проверяет число воркеров по умолчанию для разных типов воркеров.
+
+    Arrange:
+        - Мокаем sched_getaffinity: процессу доступны 4 CPU.
+
+    Act:
+        - Загружаем конфигурацию с заданным GUNICORN_WORKER_CLASS.
+
+    Assert:
+        - Для sync воркеров 2 * CPU + 1, для uvicorn - по одному на CPU.
+    """
+    monkeypatch.setattr(os, 'sched_getaffinity', lambda pid: {0, 1, 2, 3}, raising=False)
+
+    config = load_config(GUNICORN_WORKER_CLASS=worker_class)
+
+    assert config.workers == expected_workers
+    assert config._default_workers() == expected_workers
+
+
+def test_default_workers_without_sched_getaffinity(
+    load_config: Callable[..., ModuleType],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Проверяет число воркеров на платформах без sched_getaffinity.
+
+    Arrange:
+        - Удаляем sched_getaffinity и мокаем cpu_count: 2 CPU.
+
+    Act:
+        - Загружаем конфигурацию с sync воркерами.
+
+    Assert:
+        - Число воркеров вычислено из cpu_count.
+    """
+    monkeypatch.delattr(os, 'sched_getaffinity', raising=False)
+    monkeypatch.setattr(os, 'cpu_count', lambda: 2)
+
+    config = load_config(GUNICORN_WORKER_CLASS='sync')
+
+    assert config.workers == 5
+
+
+def test_invalid_worker_class(load_config: Callable[..., ModuleType]) -> None:
+    """
+    Проверяет отказ запуска с неизвестным типом воркеров.
+
+    Arrange:
+        - Задаём GUNICORN_WORKER_CLASS, которого нет в WORKER_CLASSES.
+
+    Act:
+        - Загружаем конфигурацию.
+
+    Assert:
+        - Выброшен RuntimeError с перечнем допустимых значений.
+    """
+    with pytest.raises(RuntimeError, match='must be one of sync, gevent, uvicorn'):
+        load_config(GUNICORN_WORKER_CLASS='eventlet')
@@ -0,0 +1,60 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from config import warmup
+
+
+def test_get_memory_kb_parses_smaps_rollup(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Проверяет разбор /proc/self/smaps_rollup.
+
+    Arrange:
+        - Подменяем smaps_rollup файлом с заголовком и счётчиками памяти.
+
+    Act:
+        - Вызываем get_memory_kb.
+
+    Assert:
+        - Возвращены Rss и сумма Private_Clean и Private_Dirty.
+    """
+    smaps = tmp_path / 'smaps_rollup'
+    smaps.write_text(
+        '55d0c0a4b000-7ffd2f5fe000 ---p 00000000 00:00 0                          [rollup]\n'
+        'Rss:               51200 kB\n'
+        'Pss:               20480 kB\n'
+        'Shared_Clean:      30720 kB\n'
+        'Private_Clean:      1024 kB\n'
+        'Private_Dirty:     15360 kB\n',
+    )
+    monkeypatch.setattr(warmup, 'SMAPS_ROLLUP', smaps)
+
+    rss, private = warmup.get_memory_kb()
+
+    assert rss == 51200
+    assert private == 16384
+
+
+def test_get_memory_kb_without_proc(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Проверяет запасной вариант при отсутствии /proc.
+
+    Arrange:
+        - Подменяем smaps_rollup несуществующим путём и мокаем getrusage.
+
+    Act:
+        - Вызываем get_memory_kb.
+
+    Assert:
+        - Возвращён пиковый RSS из getrusage и нулевая приватная память.
+    """
+    monkeypatch.setattr(warmup, 'SMAPS_ROLLUP', tmp_path / 'missing')
+    getrusage = Mock(return_value=Mock(ru_maxrss=40960))
+    monkeypatch.setattr(warmup.resource, 'getrusage', getrusage)
+
+    rss, private = warmup.get_memory_kb()
+
+    assert rss == 40960
+    assert private == 0
+    getrusage.assert_called_once_with(warmup.resource.RUSAGE_SELF)
@@ -22,6 +22,7 @@ api_urlpatterns = [
 ]
 
 urlpatterns = [
+    path('', include('commons.api.urls', namespace='commons_api')),
     path('admin/', admin.site.urls),
     path('api/v1/', include(api_urlpatterns)),
 ]
@@ -0,0 +1,77 @@
+"""
+Прогрев Django-приложения для production-запуска под gunicorn.
+
+Функции вызываются из хуков ``config/gunicorn.py``: ``warmup_application`` - в master-процессе
+до fork (с ``preload_app``), чтобы импортированные модули и кеши разделялись воркерами через
+copy-on-write; ``prime_connections`` - в каждом воркере после fork, так как сокеты нельзя
+разделять между процессами.
+"""
+
+import gc
+import resource
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hashers
+from django.db import connections
+from django.urls import get_resolver
+from django.utils import translation
+from django.utils.module_loading import autodiscover_modules
+
+from commons.redis import get_redis
+
+SMAPS_ROLLUP = Path('/proc/self/smaps_rollup')
+
+
+def warmup_application() -> None:
+    """
+    Импортирует URLconf, views, сериализаторы и пакет redis и заполняет ленивые кеши Django.
+
+    Открытые при прогреве соединения с БД закрываются, чтобы воркеры не унаследовали их после fork.
+    Клиент Redis с пулом соединений и его блокировками создаётся уже в воркере (prime_connections).
+    Объекты master переносятся в постоянное поколение GC, чтобы сборщик в воркерах не трогал
+    их заголовки и не копировал разделяемые страницы.
+    """
+    resolver = get_resolver()
+    resolver.url_patterns  # noqa: B018
+    resolver.reverse_dict  # noqa: B018
+    autodiscover_modules('api.serializers')
+    get_hashers()
+    translation.activate(settings.LANGUAGE_CODE)
+    translation.deactivate()
+    import redis  # noqa: F401
+
+    connections.close_all()
+    gc.freeze()
+
+
+def prime_connections(*, database: bool = True) -> None:
+    """
+    Открывает соединения с БД и Redis, чтобы первый запрос воркера не платил за подключение.
+
+    :param database: открывать ли соединение с БД; для gevent/ASGI воркеров соединения Django
+        привязаны к greenlet/потоку запроса, поэтому прогрев БД в них бесполезен
+    """
+    if database:
+        for connection in connections.all(initialized_only=False):
+            connection.ensure_connection()
+    get_redis().ping()
+
+
+def get_memory_kb() -> tuple[int, int]:
+    """
+    Возвращает RSS процесса и его приватную часть в килобайтах.
+
+    RSS включает страницы, разделяемые с master через copy-on-write; приватная часть показывает,
+    сколько памяти воркер занимает сверх разделяемой.
+
+    :return: кортеж (rss, private); при отсутствии /proc - пиковый RSS и 0
+    """
+    if not SMAPS_ROLLUP.exists():
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, 0
+
+    values = {}
+    for line in SMAPS_ROLLUP.read_text().splitlines()[1:]:
+        name, value, *_ = line.split()
+        values[name.rstrip(':')] = int(value)
+    return values['Rss'], values['Private_Clean'] + values['Private_Dirty']
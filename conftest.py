@@ -0,0 +1,12 @@
+import pytest
+from rest_framework.test import APIClient
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    """
+    Фикстура для клиента API.
+
+    :return: экземпляр APIClient для выполнения HTTP-запросов в тестах
+    """
+    return APIClient()
@@ -20,6 +20,14 @@ wait_for_service() {
     echo "$service готов!"
 }
 
+# Production-запуск использует config/settings/prod.py независимо от ENVIRONMENT из .env/docker-compose
+if [ "$1" = "prod" ]; then
+    if [ -n "$ENVIRONMENT" ] && [ "$ENVIRONMENT" != "prod" ]; then
+        echo "ENVIRONMENT=$ENVIRONMENT заменено на prod для режима prod"
+    fi
+    export ENVIRONMENT=prod
+fi
+
 # Ожидание Redis если он используется
 if [ -n "$REDIS_URL" ]; then
     wait_for_service redis 6379 "Redis"
@@ -30,7 +38,7 @@ echo "Применение миграций..."
 python manage.py migrate --no-input
 
 # Сбор статических файлов в продакшене
-if [ "$MODE" = "prod" ] || [ "$DEBUG" = "False" ]; then
+if [ "$ENVIRONMENT" = "prod" ] || [ "$MODE" = "prod" ] || [ "$DEBUG" = "False" ]; then
     echo "Сбор статических файлов..."
     python manage.py collectstatic --no-input --clear
 fi
@@ -43,18 +51,8 @@ case "$1" in
         ;;
     "prod")
         echo "Запуск в продакшн режиме..."
-        exec gunicorn core.wsgi:application \
-            --bind 0.0.0.0:8000 \
-            --workers 4 \
-            --worker-class gevent \
-            --worker-connections 1000 \
-            --max-requests 1000 \
-            --max-requests-jitter 100 \
-            --timeout 30 \
-            --keep-alive 2 \
-            --log-level info \
-            --access-logfile - \
-            --error-logfile -
+        # Тип воркеров (sync/gevent/uvicorn) и их число задаются GUNICORN_* переменными, см. config/gunicorn.py
+        exec gunicorn --config config/gunicorn.py
         ;;
     "celery-worker")
         echo "Запуск Celery Worker..."